@@ -16,17 +16,43 @@ Usage examples (PowerShell):
 from __future__ import annotations
 
 import argparse
+import csv
+import functools
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    _HAS_PYARROW = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_PYARROW = False
+
 
 MARKER_EMPTY = "__EMPTY__"
 
+# --quoting choice -> csv module constant; "none" backslash-escapes separators, backslashes and
+# newlines (not quotes: pandas drops the quotechar under QUOTE_NONE)
+_QUOTING = {"minimal": csv.QUOTE_MINIMAL, "none": csv.QUOTE_NONE}
+_WRITE_BUFFER_BYTES = 1 << 20
+# Inputs above this size are memory-mapped for the Arrow reader
+_MMAP_THRESHOLD_BYTES = 512 << 20
+
+# pandas' default NA tokens (keep_default_na=True); pyarrow's defaults lack the last two
+_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "N/A", "NA", "NULL", "NaN", "n/a", "nan", "null", "<NA>", "None",
+]
+
 
 @dataclass
 class RunStats:
@@ -38,6 +64,33 @@ class RunStats:
     runtime_seconds: float = 0.0
 
 
+@dataclass(frozen=True, slots=True)
+class CleanerCfg:
+    """Parsed command-line options (plain slot reads instead of Namespace lookups)."""
+
+    input: str
+    output: str
+    dedupe_on: str
+    empty_policy: str
+    sep: str
+    report: str
+    quoting: str = "minimal"
+    count_empties_on: Optional[str] = None
+    engine: str = "pandas"
+    chunksize: Optional[int] = None
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be an integer >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {number}")
+    return number
+
+
 def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="csv-cleaner-demo",
@@ -57,6 +110,31 @@ def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
         help='How to handle empty cells: "delete-row" removes any row that has an empty cell; "mark" replaces empties with "__EMPTY__"',
     )
     parser.add_argument("--sep", default=",", help='CSV separator (default ",")')
+    parser.add_argument(
+        "--quoting",
+        default="minimal",
+        choices=sorted(_QUOTING),
+        help='Output quoting: "minimal" (default) quotes only values that need it; '
+        '"none" never quotes (only for data without separators, quotes or newlines)',
+    )
+    parser.add_argument(
+        "--count-empties-on",
+        default=None,
+        help="Comma-separated columns to check for empty cells (count and policy); default checks all columns",
+    )
+    parser.add_argument(
+        "--engine",
+        default="pandas",
+        choices=["pandas", "polars"],
+        help='Processing backend (default "pandas"); "polars" requires the optional polars package',
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=_positive_int,
+        default=None,
+        help="Stream the input in chunks of this many rows to cap memory on large files "
+        "(dedup then tracks 64-bit row hashes instead of whole rows; not with --engine polars)",
+    )
     parser.add_argument(
         "--report",
         required=True,
@@ -66,6 +144,11 @@ def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _split_columns(spec: str) -> List[str]:
+    """Parse a comma-separated column list, ignoring blanks around and between names."""
+    return [c.strip() for c in spec.split(",") if c.strip()]
+
+
 def _ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -73,10 +156,25 @@ def _ensure_parent_dir(path: Path) -> None:
 def _load_csv(path: Path, sep: str) -> Tuple[pd.DataFrame, int]:
     """Load CSV as all strings; handle empty files gracefully.
 
+    Columns are Arrow-backed strings when pyarrow is installed (contiguous
+    buffers instead of one Python object per cell), plain object otherwise.
+
     Returns DataFrame and total input rows (excluding header).
     """
+    dtype = "string[pyarrow]" if _HAS_PYARROW else str
     try:
-        df = pd.read_csv(path, sep=sep, dtype=str, keep_default_na=True)
+        # Header only: raises EmptyDataError for empty files and gives pandas' column names
+        columns = pd.read_csv(path, sep=sep, nrows=0).columns.tolist()
+        # Single column: pandas skips whitespace-only lines as blank, Arrow keeps them as a value
+        if _HAS_PYARROW and len(sep) == 1 and len(columns) > 1:
+            try:
+                df = _read_csv_pyarrow(path, sep, columns)
+                if df is not None:
+                    return df, len(df)
+            except pa.ArrowInvalid:
+                # Malformed for Arrow's parser; let the C engine decide/report
+                pass
+        df = pd.read_csv(path, sep=sep, dtype=dtype, keep_default_na=True)
         return df, len(df)
     except FileNotFoundError:
         raise
@@ -85,41 +183,182 @@ def _load_csv(path: Path, sep: str) -> Tuple[pd.DataFrame, int]:
         return pd.DataFrame(), 0
 
 
+def _read_csv_pyarrow(path: Path, sep: str, columns: List[str]) -> Optional[pd.DataFrame]:
+    """Parse with Arrow's multi-threaded CSV reader, every column typed as string.
+
+    pandas' engine="pyarrow" infers types first and casts afterwards (turning
+    "007" into "7"), so the reader is called directly with explicit column types.
+    Arrow reads the header itself (skipping leading empty lines like pandas,
+    though not whitespace-only ones, so single-column files stay on the C
+    engine); its columns are then renamed to pandas' ``columns`` (mangled
+    duplicates, "Unnamed: n"). Large files are memory-mapped, which skips a
+    copy through a read buffer.
+
+    Returns None if Arrow's header differs from pandas', so the caller can fall back.
+    """
+    # Raw header cells as pandas sees them, keyed for Arrow's column_types
+    raw_header = pd.read_csv(path, sep=sep, header=None, nrows=1, dtype=str, keep_default_na=False)
+    raw_names = raw_header.iloc[0].tolist() if len(raw_header) else []
+    if len(raw_names) != len(columns):
+        return None
+    options = dict(
+        parse_options=pa_csv.ParseOptions(delimiter=sep),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={c: pa.string() for c in raw_names},
+            null_values=_NA_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+    if path.stat().st_size > _MMAP_THRESHOLD_BYTES:
+        with pa.memory_map(str(path), "r") as source:
+            table = pa_csv.read_csv(source, **options)
+    else:
+        table = pa_csv.read_csv(path, **options)
+    if table.column_names != raw_names:
+        return None
+    table = table.rename_columns(columns)
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
+
+
 def _trim_strings(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
-    return df.applymap(lambda x: x.strip() if isinstance(x, str) else x)
+    # Vectorized per-column strip; .str.strip passes NA through unchanged
+    cols = df.select_dtypes(include=["object", "string"]).columns.tolist()
+    # Only Arrow's trim kernel releases the GIL; object .str.strip would just contend for it
+    arrow_backed = all(isinstance(df[c].dtype, pd.StringDtype) and df[c].dtype.storage == "pyarrow" for c in cols)
+    workers = min(len(cols), os.cpu_count() or 1) if arrow_backed else 1
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            stripped = list(pool.map(lambda c: df[c].str.strip(), cols))
+    else:
+        stripped = [df[c].str.strip() for c in cols]
+    for col, values in zip(cols, stripped):
+        df[col] = values
+    return df
+
+
+def _empty_mask(df: pd.DataFrame, columns: Optional[List[str]] = None) -> Tuple[np.ndarray, List[int]]:
+    """Boolean (rows x checked columns) mask of cells that are NA or an empty string.
 
+    Built column by column from the comparison result, so no cleaned copy of
+    the frame is materialized just to find the empties. If ``columns`` is given,
+    only those are checked and the mask has one column per checked column.
 
-def _handle_empty_cells(df: pd.DataFrame, policy: str) -> Tuple[pd.DataFrame, int, int]:
-    """Normalize empty strings to NA, count empties, then apply policy.
+    Returns (mask, positions) where ``positions[j]`` is the frame position of mask column j.
+    """
+    positions = [i for i, name in enumerate(df.columns) if columns is None or name in columns]
+    mask = np.empty((len(df), len(positions)), dtype=bool)
+    for j, i in enumerate(positions):
+        col = df.iloc[:, i]
+        # StringDtype: NA compares as NA, so one comparison pass covers both cases;
+        # object: NaN compares as False and needs a separate isna pass
+        mask[:, j] = col.eq("").to_numpy(dtype=bool, na_value=True)
+        if not isinstance(col.dtype, pd.StringDtype):
+            mask[:, j] |= col.isna().to_numpy()
+    return mask, positions
+
+
+def _handle_empty_cells(
+    df: pd.DataFrame, policy: str, empty_cols: Optional[List[str]] = None
+) -> Tuple[pd.DataFrame, int, int]:
+    """Count empty cells (NA or empty string), then apply policy.
+
+    ``empty_cols`` limits the check to those columns (None = all columns).
 
     Returns (df_after, empty_cells_found, rows_dropped_due_to_empty)
     """
     if df.empty:
         return df, 0, 0
 
-    # Normalize purely empty strings to NA to count empties reliably
-    df = df.replace("", pd.NA)
-
-    empty_cells_found = int(df.isna().sum().sum())
+    # Build the empty mask once; reused for the count and for the policy
+    na_mask, positions = _empty_mask(df, empty_cols)
+    empty_cells_found = int(np.count_nonzero(na_mask))
 
     rows_dropped = 0
     if policy == "delete-row":
-        if len(df.columns) == 0:
-            # No columns -> dropping rows doesn't make sense; nothing to drop
+        if not positions:
+            # No (checked) columns -> dropping rows doesn't make sense; nothing to drop
             return df, empty_cells_found, 0
-        rows_with_empty = df.isna().any(axis=1)
-        rows_dropped = int(rows_with_empty.sum())
-        df = df.loc[~rows_with_empty].copy()
+        rows_with_empty = na_mask.any(axis=1)
+        rows_dropped = int(np.count_nonzero(rows_with_empty))
+        df = df.loc[~rows_with_empty]
     elif policy == "mark":
-        df = df.fillna(MARKER_EMPTY)
+        # Only rewrite columns that actually contain empties; Arrow arrays are
+        # immutable, so this is as close to writing just the empty cells as it gets
+        for j, i in enumerate(positions):
+            col_mask = na_mask[:, j]
+            if col_mask.any():
+                df.isetitem(i, df.iloc[:, i].mask(col_mask, MARKER_EMPTY))
     else:
         raise ValueError(f"Unknown empty policy: {policy}")
 
     return df, empty_cells_found, rows_dropped
 
 
+_FNV_OFFSET = np.uint64(0xCBF29CE484222325)
+_FNV_PRIME = np.uint64(0x100000001B3)
+
+
+def _row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """Hash each row to a single uint64 (independent of the index).
+
+    Uses a numba kernel over the Arrow string buffers when numba and pyarrow are
+    installed, pandas' hash_pandas_object otherwise. Either way the
+    hashes are stable within a run, which is all chunked dedup needs.
+    """
+    kernel = _numba_string_hasher() if _HAS_PYARROW else None
+    if kernel is None:
+        return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+    hashes = np.full(len(df), _FNV_OFFSET, dtype=np.uint64)
+    for _, col in df.items():
+        arr = pa.array(col, type=pa.large_string(), from_pandas=True)
+        if isinstance(arr, pa.ChunkedArray):
+            arr = arr.combine_chunks()
+        _, offsets, data = arr.buffers()
+        kernel(
+            hashes,
+            np.frombuffer(offsets, dtype=np.int64),
+            np.frombuffer(data, dtype=np.uint8) if data is not None else np.empty(0, dtype=np.uint8),
+            arr.is_valid().to_numpy(zero_copy_only=False),
+            arr.offset,
+        )
+    return hashes
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_string_hasher():
+    """Compile (once, lazily) the numba row-hash kernel; None if numba is missing.
+
+    Imported on first use so runs that never hash rows don't pay numba's import time.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    null_hash = np.uint64(0x9E3779B97F4A7C15)
+
+    @njit(parallel=True, cache=True)
+    def fold_string_column(hashes, offsets, data, valid, base):
+        # FNV-1a over each cell's UTF-8 bytes, finalized with the murmur3 mixer,
+        # then folded into the running row hash
+        for i in prange(hashes.shape[0]):
+            if valid[i]:
+                h = _FNV_OFFSET
+                for j in range(offsets[base + i], offsets[base + i + 1]):
+                    h = (h ^ np.uint64(data[j])) * _FNV_PRIME
+            else:
+                h = null_hash
+            h ^= h >> np.uint64(33)
+            h *= np.uint64(0xFF51AFD7ED558CCD)
+            h ^= h >> np.uint64(33)
+            hashes[i] = (hashes[i] ^ h) * _FNV_PRIME
+
+    return fold_string_column
+
+
 def _deduplicate(df: pd.DataFrame, dedupe_on: str) -> Tuple[pd.DataFrame, int, List[str]]:
     """Deduplicate DataFrame rows according to parameter.
 
@@ -132,51 +371,239 @@ def _deduplicate(df: pd.DataFrame, dedupe_on: str) -> Tuple[pd.DataFrame, int, L
     used_cols: List[str] = []
 
     if dedupe_on.strip().lower() == "all":
-        df2 = df.drop_duplicates(keep="first")
+        df2 = _drop_duplicate_rows(df)
         return df2, before - len(df2), []
 
     # Parse subset list
-    requested_cols = [c.strip() for c in dedupe_on.split(",") if c.strip()]
+    requested_cols = _split_columns(dedupe_on)
     existing_cols = [c for c in requested_cols if c in df.columns]
 
     if not existing_cols:
         # Nothing to dedupe on; return unchanged
         return df, 0, []
 
-    df2 = df.drop_duplicates(subset=existing_cols, keep="first")
+    df2 = _drop_duplicate_rows(df, existing_cols)
     return df2, before - len(df2), existing_cols
 
 
-def _write_csv(df: pd.DataFrame, path: Path, sep: str) -> None:
+def _drop_duplicate_rows(df: pd.DataFrame, subset: Optional[List[str]] = None) -> pd.DataFrame:
+    """drop_duplicates(keep="first") that returns ``df`` itself when nothing is duplicated.
+
+    duplicated() factorizes the (Arrow) string columns in C and is exact; 64-bit
+    row hashes (see _row_hashes) are only used where rows cannot all be held in
+    memory (_clean_in_chunks). Single rows are returned without building a hash table.
+    """
+    if len(df) <= 1:
+        return df
+    dup = df.duplicated(subset=subset, keep="first")
+    return df.loc[~dup] if dup.any() else df
+
+
+def _write_csv(df: pd.DataFrame, path: Path, sep: str, append: bool = False, quoting: str = "minimal") -> None:
     _ensure_parent_dir(path)
+    csv_options = dict(
+        sep=sep,
+        index=False,
+        lineterminator="\n",
+        quoting=_QUOTING[quoting],
+        escapechar="\\" if quoting == "none" else None,
+    )
+    # Arrow's writer is ~20x faster than to_csv; with quoting disabled its output is
+    # byte-identical to pandas' minimal quoting for values that need no quoting.
+    # Not used for --quoting none: Arrow cannot escape the escape character itself.
+    # Single-column frames are excluded because pandas quotes empty fields there.
+    if _HAS_PYARROW and quoting == "minimal" and len(df.columns) > 1 and len(sep) == 1:
+        with path.open("ab" if append else "wb") as f:
+            start = f.tell()
+            try:
+                if not append:
+                    f.write(df.head(0).to_csv(**csv_options).encode("utf-8"))
+                pa_csv.write_csv(
+                    pa.Table.from_pandas(df, preserve_index=False),
+                    f,
+                    write_options=pa_csv.WriteOptions(include_header=False, delimiter=sep, quoting_style="none"),
+                )
+                return
+            except pa.ArrowException:
+                # A value needs quoting (delimiter, quote or newline); let pandas quote/escape it
+                f.seek(start)
+                f.truncate()
     # Ensure consistent writing of empty DataFrames
-    df.to_csv(path, sep=sep, index=False)
+    with path.open("a" if append else "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_BYTES) as f:
+        df.to_csv(f, header=not append, **csv_options)
+
+
+def _clean_in_chunks(
+    input_path: Path,
+    output_path: Path,
+    sep: str,
+    policy: str,
+    dedupe_on: str,
+    chunksize: int,
+    stats: RunStats,
+    empty_cols: Optional[List[str]] = None,
+    quoting: str = "minimal",
+) -> Tuple[List[str], List[str]]:
+    """Stream trim/empty-policy/dedup over the input and append each chunk to the output.
+
+    Duplicates across chunks are detected via a set of 64-bit row hashes, so
+    only the hashes of the key columns are kept in memory. Fills ``stats``.
+
+    Returns (columns, used_dedupe_columns)
+    """
+    try:
+        columns = pd.read_csv(input_path, sep=sep, nrows=0).columns.tolist()
+    except pd.errors.EmptyDataError:
+        # Completely empty file (no header, no rows)
+        _write_csv(pd.DataFrame(), output_path, sep)
+        return [], []
+
+    dedupe_all = dedupe_on.strip().lower() == "all"
+    if dedupe_all:
+        key_cols = columns
+    else:
+        requested_cols = _split_columns(dedupe_on)
+        key_cols = [c for c in requested_cols if c in columns]
+
+    seen: set = set()
+    deduped_any = False
+    append = False
+    reader = pd.read_csv(
+        input_path,
+        sep=sep,
+        dtype="string[pyarrow]" if _HAS_PYARROW else str,
+        keep_default_na=True,
+        chunksize=chunksize,
+    )
+    with reader:
+        for chunk in reader:
+            stats.total_input_rows += len(chunk)
+            chunk = _trim_strings(chunk)
+            chunk, empties, dropped = _handle_empty_cells(chunk, policy, empty_cols)
+            stats.empty_cells_found += empties
+            stats.rows_dropped_due_to_empty += dropped
+
+            if key_cols and not chunk.empty:
+                deduped_any = True
+                hashes = _row_hashes(chunk[key_cols])
+                keep = ~pd.Index(hashes).duplicated(keep="first")
+                keep &= np.fromiter((h not in seen for h in hashes.tolist()), dtype=bool, count=len(hashes))
+                seen.update(hashes[keep].tolist())
+                stats.duplicates_removed += int(len(chunk) - keep.sum())
+                chunk = chunk.loc[keep]
+
+            stats.total_output_rows += len(chunk)
+            _write_csv(chunk, output_path, sep, append=append, quoting=quoting)
+            append = True
+
+    if not append:
+        # Header-only input: the reader yields no chunks
+        _write_csv(pd.DataFrame(columns=columns), output_path, sep, quoting=quoting)
+
+    return columns, key_cols if deduped_any and not dedupe_all else []
+
+
+def _clean_polars(
+    input_path: Path,
+    output_path: Path,
+    sep: str,
+    policy: str,
+    dedupe_on: str,
+    stats: RunStats,
+    empty_cols: Optional[List[str]] = None,
+    quoting: str = "minimal",
+) -> Tuple[List[str], List[str]]:
+    """Run the whole pipeline with polars (multi-threaded Arrow kernels). Fills ``stats``.
+
+    Column names are the ones pandas derives (mangled duplicates, "Unnamed: n"),
+    so --dedupe-on/--count-empties-on resolve the same way on both engines.
+    Known differences from pandas: polars has no skip-blank-lines option, so
+    blank lines become rows of empty cells, and rows with more fields than the
+    header are an error rather than being parsed.
+
+    Returns (columns, used_dedupe_columns)
+    """
+    # Imported here so the default pandas engine doesn't pay polars' import time
+    try:
+        import polars as pl
+    except ImportError:
+        raise RuntimeError("--engine polars requires the polars package (pip install polars)") from None
+
+    try:
+        columns = pd.read_csv(input_path, sep=sep, nrows=0).columns.tolist()
+    except pd.errors.EmptyDataError:
+        # Completely empty file (no header, no rows)
+        _write_csv(pd.DataFrame(), output_path, sep)
+        return [], []
+
+    lf = pl.scan_csv(input_path, separator=sep, infer_schema=False, null_values=_NA_VALUES, new_columns=columns)
+    # "" -> null after trimming: polars would otherwise write empty strings as '""',
+    # whereas pandas writes both as an empty field
+    df = lf.with_columns(pl.all().str.strip_chars().replace("", None)).collect()
+    stats.total_input_rows = df.height
+
+    checked = columns if empty_cols is None else [c for c in columns if c in empty_cols]
+    is_empty = [pl.col(c).is_null() | (pl.col(c) == "") for c in checked]
+    if checked and df.height:
+        stats.empty_cells_found = int(df.select(pl.sum_horizontal(is_empty).sum()).item())
+
+    if policy == "delete-row":
+        if checked:
+            kept = df.filter(~pl.any_horizontal(is_empty))
+            stats.rows_dropped_due_to_empty = df.height - kept.height
+            df = kept
+    elif policy == "mark":
+        df = df.with_columns(
+            pl.when(empty).then(pl.lit(MARKER_EMPTY)).otherwise(pl.col(c)).alias(c)
+            for c, empty in zip(checked, is_empty)
+        )
+    else:
+        raise ValueError(f"Unknown empty policy: {policy}")
+
+    used_cols: List[str] = []
+    if df.height:
+        before = df.height
+        if dedupe_on.strip().lower() == "all":
+            df = df.unique(keep="first", maintain_order=True)
+        else:
+            requested_cols = _split_columns(dedupe_on)
+            used_cols = [c for c in requested_cols if c in columns]
+            if used_cols:
+                df = df.unique(subset=used_cols, keep="first", maintain_order=True)
+        stats.duplicates_removed = before - df.height
+
+    stats.total_output_rows = df.height
+    if quoting == "minimal":
+        _ensure_parent_dir(output_path)
+        df.write_csv(output_path, separator=sep)
+    else:
+        # polars has no escape character (quote_style="never" would emit ambiguous rows)
+        _write_csv(df.to_pandas(use_pyarrow_extension_array=True), output_path, sep, quoting=quoting)
+    return columns, used_cols
 
 
 def _write_report(path: Path, stats: RunStats, params: dict, notes: List[str]) -> None:
     _ensure_parent_dir(path)
-    lines = []
-    lines.append("CSV Cleaner Report")
-    lines.append("=" * 72)
-    lines.append("")
-    lines.append("Parameters:")
-    for k, v in params.items():
-        lines.append(f"  {k}: {v}")
-    lines.append("")
-    lines.append("Results:")
-    lines.append(f"  Total input rows: {stats.total_input_rows}")
-    lines.append(f"  Total output rows: {stats.total_output_rows}")
-    lines.append(f"  Duplicates removed: {stats.duplicates_removed}")
-    lines.append(f"  Empty cells found: {stats.empty_cells_found}")
-    lines.append(f"  Rows dropped due to empty: {stats.rows_dropped_due_to_empty}")
-    lines.append(f"  Runtime (s): {stats.runtime_seconds:.3f}")
-    if notes:
-        lines.append("")
-        lines.append("Notes:")
-        for n in notes:
-            lines.append(f"  - {n}")
-    text = "\n".join(lines) + "\n"
-    path.write_text(text, encoding="utf-8")
+    with path.open("w", encoding="utf-8") as f:
+        f.write("CSV Cleaner Report\n")
+        f.write("=" * 72 + "\n")
+        f.write("\n")
+        f.write("Parameters:\n")
+        for k, v in params.items():
+            f.write(f"  {k}: {v}\n")
+        f.write("\n")
+        f.write("Results:\n")
+        f.write(f"  Total input rows: {stats.total_input_rows}\n")
+        f.write(f"  Total output rows: {stats.total_output_rows}\n")
+        f.write(f"  Duplicates removed: {stats.duplicates_removed}\n")
+        f.write(f"  Empty cells found: {stats.empty_cells_found}\n")
+        f.write(f"  Rows dropped due to empty: {stats.rows_dropped_due_to_empty}\n")
+        f.write(f"  Runtime (s): {stats.runtime_seconds:.3f}\n")
+        if notes:
+            f.write("\n")
+            f.write("Notes:\n")
+            for n in notes:
+                f.write(f"  - {n}\n")
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -188,11 +615,34 @@ def main(argv: Optional[List[str]] = None) -> int:
         # argparse already printed the error/help
         return 2
 
-    input_path = Path(args.input)
-    output_path = Path(args.output)
-    report_path = Path(args.report)
+    cfg = CleanerCfg(
+        input=args.input,
+        output=args.output,
+        dedupe_on=args.dedupe_on,
+        empty_policy=args.empty_policy,
+        sep=args.sep,
+        report=args.report,
+        quoting=args.quoting,
+        count_empties_on=args.count_empties_on,
+        engine=args.engine,
+        chunksize=args.chunksize,
+    )
+
+    input_path = Path(cfg.input)
+    output_path = Path(cfg.output)
+    report_path = Path(cfg.report)
 
     notes: List[str] = []
+    empty_cols = None
+    if cfg.count_empties_on is not None:
+        empty_cols = _split_columns(cfg.count_empties_on)
+        if not empty_cols:
+            print("Error: --count-empties-on needs at least one column name", file=sys.stderr)
+            return 2
+
+    if cfg.engine == "polars" and cfg.chunksize is not None:
+        print("Error: --chunksize is not supported with --engine polars", file=sys.stderr)
+        return 2
 
     if not input_path.exists():
         print(f"Error: input file not found: {input_path}", file=sys.stderr)
@@ -202,35 +652,55 @@ def main(argv: Optional[List[str]] = None) -> int:
     stats = RunStats()
 
     try:
-        df, stats.total_input_rows = _load_csv(input_path, args.sep)
+        if cfg.engine == "polars":
+            columns, used_cols = _clean_polars(
+                input_path, output_path, cfg.sep, cfg.empty_policy, cfg.dedupe_on, stats, empty_cols, cfg.quoting
+            )
+        elif cfg.chunksize is not None:
+            # Stream: outputs are written chunk by chunk
+            columns, used_cols = _clean_in_chunks(
+                input_path, output_path, cfg.sep, cfg.empty_policy, cfg.dedupe_on, cfg.chunksize, stats, empty_cols, cfg.quoting
+            )
+        else:
+            df, stats.total_input_rows = _load_csv(input_path, cfg.sep)
+
+            # Trim whitespace
+            df = _trim_strings(df)
 
-        # Trim whitespace
-        df = _trim_strings(df)
+            # Handle empties
+            df, stats.empty_cells_found, stats.rows_dropped_due_to_empty = _handle_empty_cells(df, cfg.empty_policy, empty_cols)
 
-        # Handle empties
-        df, stats.empty_cells_found, stats.rows_dropped_due_to_empty = _handle_empty_cells(df, args["empty_policy"] if isinstance(args, dict) else args.empty_policy)
+            # Deduplicate
+            df, stats.duplicates_removed, used_cols = _deduplicate(df, cfg.dedupe_on)
+            columns = df.columns.tolist()
+
+            stats.total_output_rows = len(df)
+
+            # Write outputs
+            _write_csv(df, output_path, cfg.sep, quoting=cfg.quoting)
 
-        # Deduplicate
-        df, stats.duplicates_removed, used_cols = _deduplicate(df, args["dedupe_on"] if isinstance(args, dict) else args.dedupe_on)
         if used_cols:
             notes.append(f"Deduplication used columns: {', '.join(used_cols)}")
-        elif (args["dedupe_on"] if isinstance(args, dict) else args.dedupe_on).strip().lower() != "all":
-            requested = [c.strip() for c in (args["dedupe_on"] if isinstance(args, dict) else args.dedupe_on).split(",") if c.strip()]
-            missing = [c for c in requested if df.columns.tolist() and c not in df.columns]
+        elif cfg.dedupe_on.strip().lower() != "all":
+            requested = _split_columns(cfg.dedupe_on)
+            missing = [c for c in requested if columns and c not in columns]
             if missing:
                 notes.append(f"Requested dedupe columns not found and were ignored: {', '.join(missing)}")
-
-        stats.total_output_rows = len(df)
-
-        # Write outputs
-        _write_csv(df, output_path, args.sep)
+        if empty_cols is not None:
+            missing = [c for c in empty_cols if columns and c not in columns]
+            if missing:
+                notes.append(f"Requested empty-check columns not found and were ignored: {', '.join(missing)}")
 
         params = {
             "input": str(input_path),
             "output": str(output_path),
-            "dedupe_on": args.dedupe_on,
-            "empty_policy": args.empty_policy,
-            "sep": args.sep,
+            "dedupe_on": cfg.dedupe_on,
+            "empty_policy": cfg.empty_policy,
+            "sep": cfg.sep,
+            "quoting": cfg.quoting,
+            "count_empties_on": cfg.count_empties_on,
+            "engine": cfg.engine,
+            "chunksize": cfg.chunksize,
             "report": str(report_path),
         }
 
@@ -244,9 +714,13 @@ def main(argv: Optional[List[str]] = None) -> int:
             params = {
                 "input": str(input_path),
                 "output": str(output_path),
-                "dedupe_on": args.dedupe_on,
-                "empty_policy": args.empty_policy,
-                "sep": args.sep,
+                "dedupe_on": cfg.dedupe_on,
+                "empty_policy": cfg.empty_policy,
+                "sep": cfg.sep,
+                "quoting": cfg.quoting,
+                "count_empties_on": cfg.count_empties_on,
+                "engine": cfg.engine,
+                "chunksize": cfg.chunksize,
                 "report": str(report_path),
             }
             stats.runtime_seconds = time.perf_counter() - start
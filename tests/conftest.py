@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# main.py lives at the project root, which is not a package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,45 @@
+"""Check the Arrow CSV reader against pandas' own pd.read_csv(dtype=str)."""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import main  # noqa: E402
+
+
+def _as_object(df: pd.DataFrame) -> pd.DataFrame:
+    # Arrow-backed strings vs object: compare values with NA normalized to None
+    return df.astype(object).where(df.notna(), None)
+
+
+CASES = {
+    "leading_zero_ids": "id,code\n007,0001\n010,00\n",
+    "na_tokens": "v,w\n" + "".join(f"{tok},x\n" for tok in main._NA_VALUES),
+    "duplicate_and_empty_headers": "a,a,,b,\n1,2,3,4,5\n6,7,8,9,10\n",
+    "leading_blank_lines": "\n\na,b\n1,2\n",
+    "leading_whitespace_lines": "  \n\t\na,b\n1,2\n",
+    "interior_blank_lines": "a,b\n1,2\n\n3,4\n\n",
+    "interior_whitespace_lines": "a,b\n1,2\n  \n3,4\n",
+    "single_column_whitespace_line": "name\nalice\n  \nbob\n",
+    "single_column_blank_line": "name\nalice\n\nbob\n",
+    "short_rows": "a,b,c\n1,2\n3\n4,5,6\n",
+    "long_rows": "a,b\n1,2\n3,4,5\n",
+    "quoted_fields": 'a,b\n"x,y","say ""hi"""\n"multi\nline",z\n',
+}
+
+
+@pytest.mark.parametrize("sep", [",", ";", "\t"])
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_load_csv_matches_read_csv(tmp_path, name, sep):
+    path = tmp_path / "in.csv"
+    path.write_text(CASES[name].replace(",", sep), encoding="utf-8", newline="")
+    try:
+        expected = pd.read_csv(path, sep=sep, dtype=str)
+    except pd.errors.ParserError:
+        with pytest.raises(pd.errors.ParserError):
+            main._load_csv(path, sep)
+        return
+    df, rows = main._load_csv(path, sep)
+    assert rows == len(expected)
+    pd.testing.assert_frame_equal(_as_object(df), _as_object(expected))
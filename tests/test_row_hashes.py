@@ -0,0 +1,44 @@
+"""Check the numba row-hash kernel against pandas' exact duplicated()."""
+
+import random
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("numba")
+
+import main  # noqa: E402
+
+
+def _assert_matches_duplicated(df: pd.DataFrame) -> None:
+    hashes = main._row_hashes(df)
+    assert main._numba_string_hasher() is not None
+    assert (pd.Index(hashes).duplicated(keep="first") == df.duplicated(keep="first").to_numpy()).all()
+
+
+@pytest.mark.parametrize("dtype", ["string[pyarrow]", object])
+def test_na_empty_and_swapped_concatenation(dtype):
+    df = pd.DataFrame(
+        {
+            "a": ["ab", "a", None, "", None, "", "ab", "x"],
+            "b": ["c", "bc", "", None, None, "", "c", "y"],
+        },
+        dtype=dtype,
+    )
+    # only the repeated ("ab", "c") row is a duplicate; NA and "" stay distinct
+    assert df.duplicated().sum() == 1
+    _assert_matches_duplicated(df)
+
+
+def test_random_rows_and_offset_slice():
+    rng = random.Random(0)
+    values = [None, "", "a", "b", "ab", "ba", "é", " a"]
+    df = pd.DataFrame(
+        {c: [rng.choice(values) for _ in range(5000)] for c in ("x", "y", "z")},
+        dtype="string[pyarrow]",
+    )
+    _assert_matches_duplicated(df)
+    # sliced frames are backed by Arrow arrays with a non-zero offset
+    _assert_matches_duplicated(df.iloc[1234:])
+    assert (main._row_hashes(df.iloc[1234:]) == main._row_hashes(df)[1234:]).all()
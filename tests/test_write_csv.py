@@ -0,0 +1,74 @@
+"""Check that _write_csv produces exactly pandas' to_csv bytes.
+
+The Arrow fast path relies on pyarrow's quoting_style="none" raising for any
+value that would need quoting; if an upgrade changes that, these fail.
+"""
+
+import pandas as pd
+import pytest
+
+pa_csv = pytest.importorskip("pyarrow.csv")
+
+import main  # noqa: E402
+
+SEPS = [",", ";", "\t", "|", " "]
+
+
+def _frame(values, dtype="string[pyarrow]") -> pd.DataFrame:
+    return pd.DataFrame({"a": values, "b": list(reversed(values))}, dtype=dtype)
+
+
+def _expected(df: pd.DataFrame, sep: str, header: bool = True) -> bytes:
+    return df.to_csv(sep=sep, index=False, lineterminator="\n", header=header).encode("utf-8")
+
+
+PLAIN = ["x", "007", "", None, "two words", "ünï"]
+NEEDS_QUOTING = {
+    "separator": "a{sep}b",
+    "quote": 'say "hi"',
+    "newline": "line1\nline2",
+    "carriage_return": "line1\rline2",
+    "leading_quote": '"q',
+}
+
+
+@pytest.mark.parametrize("sep", SEPS)
+@pytest.mark.parametrize("dtype", ["string[pyarrow]", object])
+def test_plain_values_use_arrow_and_match_to_csv(tmp_path, monkeypatch, sep, dtype):
+    calls = []
+    write_csv = pa_csv.write_csv
+    monkeypatch.setattr(main.pa_csv, "write_csv", lambda *a, **k: (calls.append(1), write_csv(*a, **k)))
+    df = _frame(PLAIN, dtype)
+    path = tmp_path / "out.csv"
+    main._write_csv(df, path, sep)
+    assert path.read_bytes() == _expected(df, sep)
+    assert calls, "expected the Arrow writer to handle values that need no quoting"
+
+
+@pytest.mark.parametrize("sep", SEPS)
+@pytest.mark.parametrize("case", sorted(NEEDS_QUOTING))
+def test_values_needing_quotes_match_to_csv(tmp_path, sep, case):
+    df = _frame(PLAIN + [NEEDS_QUOTING[case].format(sep=sep)])
+    path = tmp_path / "out.csv"
+    main._write_csv(df, path, sep)
+    assert path.read_bytes() == _expected(df, sep)
+
+
+@pytest.mark.parametrize("sep", SEPS)
+@pytest.mark.parametrize("case", sorted(NEEDS_QUOTING))
+def test_append_fallback_truncates_partial_arrow_output(tmp_path, sep, case):
+    first = _frame(PLAIN)
+    # Quoted value in the middle, past Arrow's first 1024-row batch, so some rows
+    # are already written when it raises and must be truncated before pandas appends
+    second = _frame(["y"] * 3000 + [NEEDS_QUOTING[case].format(sep=sep)] + ["z"] * 3000)
+    path = tmp_path / "out.csv"
+    main._write_csv(first, path, sep)
+    main._write_csv(second, path, sep, append=True)
+    assert path.read_bytes() == _expected(first, sep) + _expected(second, sep, header=False)
+
+
+def test_empty_frame_matches_to_csv(tmp_path):
+    df = _frame([])
+    path = tmp_path / "out.csv"
+    main._write_csv(df, path, ",")
+    assert path.read_bytes() == _expected(df, ",")